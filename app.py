@@ -5,30 +5,26 @@ view layers to create a running Dash application.  It instantiates
 each component and injects dependencies via the constructor, making
 the wiring explicit and testable.
 
+Layer imports happen inside the factory functions rather than at
+module scope, so importing this module (e.g. from a WSGI server or a
+test harness) stays cheap until an application is actually built.
+
 Usage:
     $ python app.py
 """
 
 from __future__ import annotations
 
-import logging
-
-from models.data_model import DataModel
-from services.data_service import DataService
-from viewmodels.data_viewmodel import DataViewModel
-from views.dash_view import create_app
-from utils import config
 
+def _build_viewmodel():
+    """Wire up the model, service and view‑model layers.
 
-def main() -> None:
-    """Create and run the Dash application.
-
-    This function should remain minimal, performing only the
-    composition of the different layers.  Business logic belongs
-    inside the view‑model or service classes.
+    Returns:
+        DataViewModel: The fully composed view‑model.
     """
-    logging.basicConfig(level=logging.INFO)
-    logger = logging.getLogger(__name__)
+    from models.data_model import DataModel
+    from services.data_service import DataService
+    from viewmodels.data_viewmodel import DataViewModel
 
     # Initialise the model that knows how to load and represent data.
     data_model = DataModel()
@@ -38,10 +34,41 @@ def main() -> None:
     data_service = DataService(model=data_model)
     # ViewModel orchestrates application state and prepares data for
     # presentation.
-    data_viewmodel = DataViewModel(service=data_service)
+    return DataViewModel(service=data_service)
+
+
+def create_wsgi_app():
+    """Build the Dash application and return its WSGI server.
+
+    This is the entry point for production servers, e.g.::
+
+        gunicorn "app:create_wsgi_app()"
+
+    Returns:
+        flask.Flask: The underlying WSGI application.
+    """
+    from views.dash_view import create_app
+
+    return create_app(_build_viewmodel()).server
+
+
+def main() -> None:
+    """Create and run the Dash application.
+
+    This function should remain minimal, performing only the
+    composition of the different layers.  Business logic belongs
+    inside the view‑model or service classes.
+    """
+    import logging
+
+    from views.dash_view import create_app
+    from utils import config
+
+    logger = logging.getLogger(__name__)
+
     # Create the Dash app by injecting the view‑model.  The view
     # encapsulates all layout and callback definitions.
-    dash_app = create_app(data_viewmodel)
+    dash_app = create_app(_build_viewmodel())
     logger.info("Starting Dash server on %s:%s (debug=%s)...", config.HOST, config.PORT, config.DEBUG_MODE)
     # Use configuration values for host, port and debug mode.  This
     # allows these settings to be overridden via environment variables.
@@ -49,4 +76,9 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    import logging
+
+    # Configure the root logger only when run as a script, so merely
+    # importing this module leaves logging untouched.
+    logging.basicConfig(level=logging.INFO)
+    main()
@@ -9,19 +9,106 @@ databases, reading files or querying external APIs.
 
 from __future__ import annotations
 
+import atexit
+import functools
+import hashlib
+import io
+import os
+import re
+import tempfile
+import threading
+import time
 from dataclasses import dataclass, field
-from typing import Optional, Union, List, cast
-
-import pandas as pd
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, List
 
 from utils import config
 
-try:  # Optional dependency
-    from influxdb_client import InfluxDBClient  # type: ignore
+if TYPE_CHECKING:  # Heavy imports are deferred to the methods below
+    import pandas as pd
+    import requests
+
+
+@functools.lru_cache(maxsize=1)
+def _has_influx() -> bool:
+    """Probe for the optional influxdb-client dependency (once)."""
+    try:
+        import influxdb_client  # type: ignore # noqa: F401
+
+        return True
+    except Exception:  # pragma: no cover - optional dependency handling
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _has_fast_path() -> bool:
+    """Probe for the optional CSV query path dependencies (once)."""
+    try:
+        import pyarrow  # type: ignore # noqa: F401
+        import requests  # noqa: F401
+
+        return True
+    except Exception:  # pragma: no cover - optional dependency handling
+        return False
+
+
+# Mapping from Influx field names to the column names used by the app.
+_FIELD_COLUMNS = {
+    "statistics_total_items": "Total Items",
+    "statistics_good_reads": "Good Reads",
+    "statistics_no_reads": "No Reads",
+}
+
+# Module-level HTTP session so repeated queries reuse the same TCP/TLS
+# connection instead of paying a fresh handshake per reload.
+_session: Optional["requests.Session"] = None
+
+
+def _get_session() -> "requests.Session":
+    """Return the shared HTTP session, creating it on first use."""
+    import requests
+
+    global _session
+    if _session is None:
+        _session = requests.Session()
+    return _session
+
+
+@functools.lru_cache(maxsize=8)
+def _build_flux(bucket: str, start: str, window: str) -> str:
+    """Build the DIM2 statistics Flux query.
+
+    Memoized on its arguments so the f-string interpolation runs once
+    per distinct (bucket, start, window) combination rather than on
+    every reload.
+
+    Aggregation happens server-side via ``aggregateWindow`` so Influx
+    returns one row per window instead of every raw point, and
+    bookkeeping columns are dropped before the pivot to shrink each row
+    on the wire.
 
-    _has_influx: bool = True
-except Exception:  # pragma: no cover - optional dependency handling
-    _has_influx = False
+    Args:
+        bucket (str): Bucket to query.
+        start (str): Flux range start, either a relative duration
+            (e.g. ``-1h``) or an RFC3339 timestamp for tail queries.
+        window (str): Aggregation window (e.g. ``1m``).
+
+    Returns:
+        str: The Flux query source.
+    """
+    return f"""
+    from(bucket: "{bucket}")
+      |> range(start: {start})
+      |> filter(fn: (r) => r["_measurement"] == "device_data")
+      |> filter(fn: (r) => r["station"] == "DIM2")
+      |> filter(fn: (r) => r["message_type"] == "statistics")
+      |> filter(fn: (r) => r["_field"] == "statistics_total_items" or r["_field"] == "statistics_good_reads" or r["_field"] == "statistics_no_reads")
+      |> aggregateWindow(every: {window}, fn: mean, createEmpty: false)
+      |> drop(columns: ["_start", "_stop", "_measurement"])
+      |> pivot(rowKey:["_time"], columnKey:["_field"], valueColumn:"_value")
+      |> keep(columns: ["_time", "statistics_total_items", "statistics_good_reads", "statistics_no_reads"])
+      |> sort(columns: ["_time"])
+    """
 
 
 @dataclass
@@ -35,6 +122,8 @@ class DataModel:
     """
 
     _cache: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
+    _lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _client: Optional[Any] = field(default=None, init=False, repr=False)
 
     def _generate_sample_data(self) -> pd.DataFrame:
         """Generate a synthetic time series dataset for demonstration purposes.
@@ -42,113 +131,469 @@ class DataModel:
         Returns:
             pd.DataFrame: A DataFrame with Time and DIM2 statistics columns.
         """
+        import numpy as np
+        import pandas as pd
+
         # Create sample time series data that mimics DIM2 statistics
-        
-        # Generate timestamps for the last 6 hours 
+
+        # Generate timestamps for the last 6 hours
         end_time = pd.Timestamp.now()
         start_time = end_time - pd.Timedelta(hours=6)
         time_range = pd.date_range(start=start_time, end=end_time, freq='5min')
-        
-        # Generate realistic DIM2 statistics data
-        import numpy as np
+
+        # Generate realistic DIM2 statistics data in a single (3, n)
+        # buffer filled in place, rather than one temporary per step.
+        rng = np.random.default_rng()
         n_points = len(time_range)
-        
+        buf = np.empty((3, n_points), dtype=np.float64)
+        total_items, good_reads, no_reads = buf
+
         # Simulate total items (gradually increasing over time)
-        total_items = 800 + np.cumsum(np.random.normal(2, 1, n_points))
-        total_items = np.maximum(total_items, 0)  # Ensure non-negative
-        
+        rng.standard_normal(n_points, out=total_items)
+        total_items += 2.0  # mean 2, std 1 increments
+        np.cumsum(total_items, out=total_items)
+        total_items += 800.0
+        np.maximum(total_items, 0, out=total_items)  # Ensure non-negative
+
         # Good reads should be close to total items but slightly less
-        good_reads = total_items * np.random.uniform(0.85, 0.98, n_points)
-        
+        np.multiply(total_items, rng.uniform(0.85, 0.98, n_points), out=good_reads)
+
         # No reads should be low and occasional
-        no_reads = np.random.poisson(2, n_points)
-        
+        no_reads[:] = rng.poisson(2, n_points)
+
         df = pd.DataFrame({
             'Time': time_range,
             'Total Items': total_items,
             'Good Reads': good_reads,
             'No Reads': no_reads
         })
-        
+
         return df
 
     # --- InfluxDB integration -------------------------------------------------
     def _influx_configured(self) -> bool:
+        cfg = config.INFLUX
         return bool(
-            _has_influx
-            and config.INFLUXDB_URL
-            and config.INFLUXDB_TOKEN
-            and config.INFLUXDB_ORG
-            and config.INFLUXDB_BUCKET
+            (_has_fast_path() or _has_influx())
+            and cfg.url
+            and cfg.token
+            and cfg.org
+            and cfg.bucket
         )
 
-    def _load_from_influx(self) -> pd.DataFrame:
-        """Load DIM2 statistics data from InfluxDB as time series.
+    def _query_csv(self, flux: str) -> pd.DataFrame:
+        """Execute a Flux query over raw HTTP and parse the CSV with pyarrow.
+
+        Posting directly to ``/api/v2/query`` with ``Accept:
+        application/csv`` avoids the influx client's per-row record
+        deserialization; pyarrow parses the RFC3339 timestamps natively
+        in C, so the timestamps are only parsed once.
+
+        Args:
+            flux (str): The Flux query to execute.
 
-        Returns proper time-series data for visualization with time on x-axis
-        and metric values on y-axis.
+        Returns:
+            pd.DataFrame: The raw query result with Influx column names.
         """
-        if not self._influx_configured():  # Fallback guard
-            return self._generate_sample_data()
+        import pandas as pd
+        import pyarrow as pa
+        import pyarrow.csv as pacsv
+
+        cfg = config.INFLUX
+        session = _get_session()
+        response = session.post(
+            f"{cfg.url}/api/v2/query?org={cfg.org}",
+            headers={
+                "Authorization": f"Token {cfg.token}",
+                "Accept": "application/csv",
+                "Content-Type": "application/vnd.flux",
+            },
+            data=flux.encode("utf-8"),
+            stream=True,
+            timeout=30,
+        )
+        response.raise_for_status()
+        # Strip annotation (#-prefixed) and blank lines so pyarrow sees a
+        # plain header row followed by data rows.
+        payload = b"\n".join(
+            line for line in response.iter_lines() if line and not line.startswith(b"#")
+        )
+        column_types = {name: pa.float64() for name in _FIELD_COLUMNS}
+        column_types["_time"] = pa.timestamp("ns", tz="UTC")
+        table = pacsv.read_csv(
+            io.BytesIO(payload),
+            convert_options=pacsv.ConvertOptions(
+                column_types=column_types,
+                include_columns=["_time", *_FIELD_COLUMNS],
+            ),
+        )
+        try:
+            # Keep the frame Arrow-backed: downstream slicing and
+            # .to_numpy() calls then view the Arrow buffers zero-copy
+            # instead of converting through the pandas block manager.
+            return table.to_pandas(types_mapper=pd.ArrowDtype)
+        except Exception:  # Older pandas without ArrowDtype support
+            return table.to_pandas(split_blocks=True, self_destruct=True)
+
+    def _get_client(self) -> Any:
+        """Return a shared, gzip-enabled InfluxDB client.
+
+        Creating a client per query pays a fresh TCP+TLS handshake and
+        a new connection pool each time; holding one instance amortises
+        that across reloads.  The client is closed at interpreter exit.
+
+        Returns:
+            InfluxDBClient: The shared client instance.
+        """
+        from influxdb_client import InfluxDBClient  # type: ignore
+
+        if self._client is None:
+            cfg = config.INFLUX
+            self._client = InfluxDBClient(
+                url=cfg.url,
+                token=cfg.token,
+                org=cfg.org,
+                timeout=10_000,
+                enable_gzip=True,
+            )
+            atexit.register(self._client.close)
+        return self._client
+
+    def _reset_client(self) -> None:
+        """Close and discard the shared client so the next call rebuilds it."""
+        if self._client is not None:
+            try:
+                self._client.close()
+            except Exception:  # pragma: no cover - best-effort cleanup
+                pass
+            self._client = None
+
+    def _query_via_client(self, flux: str) -> pd.DataFrame:
+        """Execute a Flux query through the influxdb-client library.
+
+        Fallback for environments where ``requests``/``pyarrow`` are not
+        installed.  Records are consumed from ``query_stream`` into
+        fixed-size buffer chunks rather than materializing a list of
+        sub-frames and concatenating them, roughly halving peak memory.
+
+        Args:
+            flux (str): The Flux query to execute.
+
+        Returns:
+            pd.DataFrame: The raw query result with Influx column names,
+            already pivoted to one column per field.
+        """
+        import numpy as np
+        import pandas as pd
+
+        # The shared query pivots server-side, which leaves the streamed
+        # FluxRecords without _field/_value keys.  This path pivots
+        # client-side below, so strip those stages and consume the
+        # records in their regular un-pivoted shape.
+        flux = re.sub(r"\s*\|> (?:pivot|keep)\([^\n]*\)", "", flux)
+
+        chunk_size = 8192
+        time_chunks: List[Any] = []
+        field_chunks: List[Any] = []
+        value_chunks: List[Any] = []
+        t_buf = np.empty(chunk_size, dtype=object)
+        f_buf = np.empty(chunk_size, dtype=object)
+        v_buf = np.empty(chunk_size, dtype=np.float64)
+        i = 0
+        client = self._get_client()
+        try:
+            query_api = client.query_api()  # type: ignore[attr-defined]
+            for record in query_api.query_stream(flux, org=config.INFLUX.org):  # type: ignore[attr-defined]
+                value = record.get_value()
+                t_buf[i] = record.get_time()
+                f_buf[i] = record.get_field()
+                v_buf[i] = value if value is not None else np.nan
+                i += 1
+                if i == chunk_size:
+                    time_chunks.append(t_buf)
+                    field_chunks.append(f_buf)
+                    value_chunks.append(v_buf)
+                    t_buf = np.empty(chunk_size, dtype=object)
+                    f_buf = np.empty(chunk_size, dtype=object)
+                    v_buf = np.empty(chunk_size, dtype=np.float64)
+                    i = 0
+        except Exception:
+            # Drop the (possibly broken) connection so the next call
+            # rebuilds it, then let _fetch_frame handle the failure.
+            self._reset_client()
+            raise
+        if i:
+            time_chunks.append(t_buf[:i])
+            field_chunks.append(f_buf[:i])
+            value_chunks.append(v_buf[:i])
+        if not time_chunks:
+            return pd.DataFrame()
+
+        df = pd.DataFrame(
+            {
+                "_time": pd.to_datetime(np.concatenate(time_chunks), utc=True),
+                "_field": np.concatenate(field_chunks),
+                "_value": np.concatenate(value_chunks),
+            }
+        )
+        df = df.pivot_table(
+            index="_time", columns="_field", values="_value", aggfunc="last", observed=True
+        ).reset_index()
+        df.columns.name = None
+        return df
+
+    def _cache_path(self, flux: str) -> Path:
+        """Return the on-disk cache location for a given query.
+
+        The filename encodes a hash of the Flux source and the configured
+        range start, so changing either automatically misses the cache.
+
+        Args:
+            flux (str): The Flux query the cache entry belongs to.
+
+        Returns:
+            Path: Location of the Parquet cache file.
+        """
+        digest = hashlib.sha1(flux.encode("utf-8")).hexdigest()
+        name = f"dim2_{digest}_{config.INFLUX.range_start}.parquet"
+        return Path(tempfile.gettempdir()) / name
+
+    def _read_disk_cache(self, path: Path, max_age: Optional[float] = None) -> Optional[pd.DataFrame]:
+        """Return the cached frame if the file exists and is recent enough.
+
+        Args:
+            path (Path): Cache file location from :meth:`_cache_path`.
+            max_age (Optional[float]): Maximum acceptable age of the
+                cache file in seconds; None accepts any age.
+
+        Returns:
+            Optional[pd.DataFrame]: The cached frame, or None on a miss.
+        """
+        import pandas as pd
+
+        try:
+            if path.exists() and (
+                max_age is None
+                or time.time() - path.stat().st_mtime < max_age
+            ):
+                try:
+                    return pd.read_parquet(
+                        path, engine="pyarrow", dtype_backend="pyarrow"
+                    )
+                except TypeError:  # Older pandas without dtype_backend
+                    return pd.read_parquet(path, engine="pyarrow")
+        except Exception as e:  # Corrupt or unreadable cache: treat as miss
+            print(f"Influx disk cache read failed: {e}")
+        return None
+
+    def _write_disk_cache(self, df: pd.DataFrame, path: Path) -> None:
+        """Persist a query result atomically for future cold starts.
+
+        Writes to a sibling temp file and renames it into place so a
+        concurrent reader never observes a half-written file.
+
+        Args:
+            df (pd.DataFrame): The frame to persist.
+            path (Path): Cache file location from :meth:`_cache_path`.
+        """
+        tmp = path.with_suffix(".tmp")
+        try:
+            df.to_parquet(tmp, engine="pyarrow", compression="zstd")
+            os.replace(tmp, path)
+        except Exception as e:  # Caching is best-effort only
+            print(f"Influx disk cache write failed: {e}")
+            tmp.unlink(missing_ok=True)
+
+    def _fetch_frame(self, flux: str) -> Optional[pd.DataFrame]:
+        """Execute a Flux query and post-process the result.
 
-        # Hardcode the DIM2 query directly in the application code
-        flux = f"""
-        from(bucket: "{config.INFLUXDB_BUCKET}")
-          |> range(start: {config.INFLUXDB_RANGE_START})
-          |> filter(fn: (r) => r["_measurement"] == "device_data")
-          |> filter(fn: (r) => r["station"] == "DIM2")
-          |> filter(fn: (r) => r["message_type"] == "statistics")
-          |> filter(fn: (r) => r["_field"] == "statistics_total_items" or r["_field"] == "statistics_good_reads" or r["_field"] == "statistics_no_reads")
-          |> pivot(rowKey:["_time"], columnKey:["_field"], valueColumn:"_value")
-          |> keep(columns: ["_time", "statistics_total_items", "statistics_good_reads", "statistics_no_reads"])
-          |> sort(columns: ["_time"])
+        Args:
+            flux (str): The Flux query to execute.
+
+        Returns:
+            Optional[pd.DataFrame]: The frame with application column
+            names, or None when the query failed or returned unusable
+            data.
         """
+        import numpy as np
+        import pandas as pd
+
         try:
-            with InfluxDBClient(url=config.INFLUXDB_URL, token=config.INFLUXDB_TOKEN, org=config.INFLUXDB_ORG, timeout=10_000) as client:  # type: ignore
-                query_api = client.query_api()  # type: ignore[attr-defined]
-                tables: Union[pd.DataFrame, List[pd.DataFrame]] = query_api.query_data_frame(org=config.INFLUXDB_ORG, query=flux)  # type: ignore[attr-defined]
+            if _has_fast_path():
+                df = self._query_csv(flux)
+            else:
+                df = self._query_via_client(flux)
         except Exception as e:
             # Log the error for debugging
             print(f"InfluxDB query failed: {e}")
-            return self._generate_sample_data()
-
-        if isinstance(tables, list):  # influx client may return list of DFs
-            df: pd.DataFrame = pd.concat(
-                cast(List[pd.DataFrame], tables), ignore_index=True
-            )
-        else:
-            df = cast(pd.DataFrame, tables)
+            return None
 
         # Check if we got data
         if df.empty:
             print("No data returned from InfluxDB")
-            return self._generate_sample_data()
+            return None
 
         # Ensure we have the required columns
-        required_cols = ['_time', 'statistics_total_items', 'statistics_good_reads', 'statistics_no_reads']
+        required_cols = ['_time', *_FIELD_COLUMNS]
         missing_cols = [col for col in required_cols if col not in df.columns]
         if missing_cols:
             print(f"Missing columns in InfluxDB data: {missing_cols}")
-            return self._generate_sample_data()
+            return None
 
-        # Convert time and sort
-        df['_time'] = pd.to_datetime(df['_time'])
+        # Convert time and sort.  The CSV fast path already delivers a
+        # (possibly Arrow-backed) timestamp column; re-parsing it would
+        # silently convert it back to numpy blocks.
+        if not pd.api.types.is_datetime64_any_dtype(df['_time']):
+            df['_time'] = pd.to_datetime(df['_time'])
         df = df.sort_values('_time').reset_index(drop=True)
-        
+
         # Rename columns for the application
-        df = df.rename(columns={
-            '_time': 'Time',
-            'statistics_total_items': 'Total Items',
-            'statistics_good_reads': 'Good Reads', 
-            'statistics_no_reads': 'No Reads'
-        })
-        
-        # Convert numeric columns to float
-        for col in ['Total Items', 'Good Reads', 'No Reads']:
-            df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
-            
+        df = df.rename(columns={'_time': 'Time', **_FIELD_COLUMNS})
+
+        # Convert numeric columns to float in a single contiguous
+        # cast+fill instead of a coerce/fillna copy per column.  The
+        # fast check accepts Arrow float dtypes too, so fillna keeps
+        # the Arrow representation rather than round-tripping to numpy.
+        cols = list(_FIELD_COLUMNS.values())
+        dtypes = df.dtypes
+        if all(pd.api.types.is_float_dtype(dtypes[c]) for c in cols):
+            df[cols] = df[cols].fillna(0.0)
+        else:
+            try:
+                df[cols] = np.nan_to_num(
+                    df[cols].to_numpy(dtype=np.float64, na_value=np.nan), nan=0.0
+                )
+            except (TypeError, ValueError):
+                # Unparseable values: fall back to per-column coercion
+                for col in cols:
+                    df[col] = pd.to_numeric(df[col], errors='coerce').fillna(0)
+
         return df
 
+    def _range_cutoff(self) -> Optional[pd.Timestamp]:
+        """Return the absolute start of the configured range window.
+
+        Only relative durations (e.g. ``-30m``, ``-6h``, ``-7d``) can be
+        resolved; anything else yields None and truncation is skipped.
+
+        Returns:
+            Optional[pd.Timestamp]: UTC timestamp of the window start.
+        """
+        import pandas as pd
+
+        match = re.fullmatch(r"-(\d+)([smhdw])", config.INFLUX.range_start.strip())
+        if not match:
+            return None
+        amount, unit = int(match.group(1)), match.group(2)
+        unit_name = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days", "w": "weeks"}[unit]
+        return pd.Timestamp.now(tz="UTC") - pd.Timedelta(**{unit_name: amount})
+
+    def _merge_tail(self, cached: pd.DataFrame, window: Optional[str] = None) -> pd.DataFrame:
+        """Fetch rows newer than the cached window and merge them in.
+
+        Args:
+            cached (pd.DataFrame): The previously cached (stale) frame.
+            window (Optional[str]): Aggregation window forwarded to
+                :meth:`_build_flux`.
+
+        Returns:
+            pd.DataFrame: The cached frame extended with fresh rows and
+            truncated to the configured range window.
+        """
+        import pandas as pd
+
+        last_time = cached['Time'].max()
+        tail_start = last_time.isoformat()
+        if last_time.tzinfo is None:
+            tail_start += "Z"
+        cfg = config.INFLUX
+        tail = self._fetch_frame(_build_flux(cfg.bucket, tail_start, window or cfg.window))
+        if tail is None:  # Query failed or no new rows: serve what we have
+            return cached
+
+        merged = (
+            pd.concat([cached, tail], ignore_index=True)
+            .drop_duplicates(subset=['Time'], keep='last')
+            .sort_values('Time')
+            .reset_index(drop=True)
+        )
+        # Truncate rows that fell out of the range window to bound growth
+        cutoff = self._range_cutoff()
+        if cutoff is not None:
+            times = merged['Time']
+            if times.dt.tz is None:
+                cutoff = cutoff.tz_localize(None)
+            merged = merged[times >= cutoff].reset_index(drop=True)
+        return merged
+
+    def _load_from_influx(self, window: Optional[str] = None) -> pd.DataFrame:
+        """Load DIM2 statistics data from InfluxDB as time series.
+
+        Returns proper time-series data for visualization with time on
+        x-axis and metric values on y-axis.  Once a cached window exists
+        on disk, only the tail beyond its newest timestamp is re-queried
+        and merged, instead of re-fetching the whole range every time.
+
+        Args:
+            window (Optional[str]): Aggregation window (e.g. ``5m``) for
+                callers that want coarser data on zoomed-out views;
+                defaults to ``config.INFLUXDB_WINDOW``.
+        """
+        if not self._influx_configured():  # Fallback guard
+            return self._generate_sample_data()
+
+        cfg = config.INFLUX
+        flux = _build_flux(cfg.bucket, cfg.range_start, window or cfg.window)
+        cache_path = self._cache_path(flux)
+        # Serialise concurrent reloads so parallel workers don't stampede
+        # Influx with identical queries.
+        with self._lock:
+            # A cache younger than the poll cadence is served as-is; an
+            # older one (bounded by the TTL, so restarts can reuse it)
+            # becomes the base for an incremental tail fetch, keeping
+            # the dashboard advancing on every tick.
+            cached = self._read_disk_cache(cache_path, max_age=config.INFLUX_REFRESH_SECONDS)
+            if cached is not None:
+                return cached
+
+            base = self._read_disk_cache(cache_path, max_age=config.INFLUX_CACHE_TTL)
+            if base is not None and not base.empty and 'Time' in base.columns:
+                df = self._merge_tail(base, window)
+                self._write_disk_cache(df, cache_path)
+                return df
+
+            df = self._fetch_frame(flux)
+            if df is None:
+                return self._generate_sample_data()
+            self._write_disk_cache(df, cache_path)
+            return df
+
+    def data_version(self) -> float:
+        """Return a cheap token identifying the currently available data.
+
+        While the on-disk query cache is younger than the refresh
+        cadence the token is its mtime, so consumers polling this see a
+        stable value and can skip reloading entirely.  Once the cache
+        ages past that (or is missing) the token changes on every call,
+        signalling that a reload would fetch new data.  The synthetic
+        source advances once per refresh window, so the demo dashboard
+        keeps regenerating data at the poll cadence.
+
+        Returns:
+            float: Opaque version token; unequal tokens mean reload.
+        """
+        if self._influx_configured():
+            cfg = config.INFLUX
+            path = self._cache_path(_build_flux(cfg.bucket, cfg.range_start, cfg.window))
+            try:
+                mtime = path.stat().st_mtime
+                if time.time() - mtime < config.INFLUX_REFRESH_SECONDS:
+                    return mtime
+            except OSError:
+                pass
+            return time.time()
+        return time.time() // config.INFLUX_REFRESH_SECONDS
+
     def load_data(self, force_reload: bool = False) -> pd.DataFrame:
         """Load and return the dataset.
 
@@ -22,8 +22,10 @@ from __future__ import annotations
 import os
 import argparse
 from pathlib import Path
-from typing import List, Any, cast
-import pandas as pd
+from typing import TYPE_CHECKING, List, Any, cast
+
+if TYPE_CHECKING:  # Imported lazily at runtime to keep startup fast
+    import pandas as pd
 
 # Auto-load a .env file if present for convenience
 try:  # pragma: no cover - optional
@@ -40,14 +42,6 @@ try:  # pragma: no cover - optional
 except Exception:  # pragma: no cover
     pass
 
-try:
-    from influxdb_client import InfluxDBClient  # type: ignore
-except Exception as exc:  # pragma: no cover
-    raise SystemExit(
-        "influxdb-client is required. Install with 'pip install influxdb-client'."
-    ) from exc
-
-
 def env(name: str, required: bool = True, default: str | None = None) -> str:
     val = os.environ.get(name, default)
     if required and (val is None or val == ""):
@@ -101,24 +95,24 @@ def parse_args() -> argparse.Namespace:
 def run_flux(client: Any, org: str, flux: str) -> List[str]:
     """Execute a Flux query and return a list of _value entries (deduped)."""
     tables = client.query_api().query(flux, org=org)  # type: ignore[attr-defined]
-    results: List[str] = []
-    for table in tables:  # type: ignore
-        for record in table.records:  # type: ignore[attr-defined]
-            if hasattr(record, "get_value"):
-                try:  # pragma: no cover - defensive
-                    results.append(record.get_value())  # type: ignore[attr-defined]
-                except Exception:  # pragma: no cover
-                    pass
-    seen: set[str] = set()
-    deduped: List[str] = []
-    for r in results:
-        if r not in seen:
-            seen.add(r)
-            deduped.append(r)
-    return deduped
+    results = [
+        record.get_value()  # type: ignore[attr-defined]
+        for table in tables  # type: ignore
+        for record in table.records  # type: ignore[attr-defined]
+        if hasattr(record, "get_value")
+    ]
+    # dict.fromkeys dedupes in one C-level pass while preserving order
+    return list(dict.fromkeys(results))
 
 
 def main() -> None:
+    try:
+        from influxdb_client import InfluxDBClient  # type: ignore
+    except Exception as exc:  # pragma: no cover
+        raise SystemExit(
+            "influxdb-client is required. Install with 'pip install influxdb-client'."
+        ) from exc
+
     args = parse_args()
     url = env("INFLUXDB_URL")
     token = env("INFLUXDB_TOKEN")
@@ -181,6 +175,8 @@ def main() -> None:
 
         # Optional measurement sample
         if args.measurement_sample:
+            import pandas as pd
+
             meas = args.measurement_sample
             flux_sample = f"""
 from(bucket: "{bucket}")
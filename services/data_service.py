@@ -27,6 +27,15 @@ class DataService:
 
     model: DataModel
 
+    def data_version(self) -> float:
+        """Return the model's current data version token.
+
+        Returns:
+            float: Opaque token; a change means :meth:`get_data` with
+            ``force_reload=True`` would yield fresh data.
+        """
+        return self.model.data_version()
+
     def get_data(self, force_reload: bool = False) -> pd.DataFrame:
         """Retrieve data via the model.
 
@@ -10,6 +10,7 @@ environments (development, testing, production).
 from __future__ import annotations
 
 import os
+from dataclasses import dataclass
 
 # Optionally load a .env file if python-dotenv is installed.
 try:  # pragma: no cover - optional convenience
@@ -52,3 +53,42 @@ INFLUXDB_BUCKET: str = _get_env("INFLUXDB_BUCKET", "")
 INFLUXDB_RANGE_START: str = _get_env(
     "INFLUXDB_RANGE_START", "-1h"
 )  # flux range start e.g. -1h, -7d
+INFLUXDB_WINDOW: str = _get_env(
+    "INFLUXDB_WINDOW", "1m"
+)  # aggregateWindow size, e.g. 10s, 1m, 5m
+INFLUX_REFRESH_SECONDS: int = int(
+    _get_env("INFLUX_REFRESH_SECONDS", "30")
+)  # cache age beyond which a poll triggers an incremental tail fetch
+INFLUX_CACHE_TTL: int = int(
+    _get_env("INFLUX_CACHE_TTL", "300")
+)  # max age at which a restarted process may still reuse the on-disk
+#    cache as the base for a tail fetch instead of re-querying the range
+
+
+@dataclass(frozen=True, slots=True)
+class InfluxConfig:
+    """Immutable snapshot of the InfluxDB connection settings.
+
+    Hot query paths read several of these values per call; freezing
+    them into one slotted instance makes each access a slot read and
+    guarantees they cannot drift mid-request.
+    """
+
+    url: str
+    token: str
+    org: str
+    bucket: str
+    range_start: str
+    window: str
+
+
+# Snapshot assembled once at import; consumers should prefer this over
+# the individual module constants on hot paths.
+INFLUX: InfluxConfig = InfluxConfig(
+    url=INFLUXDB_URL,
+    token=INFLUXDB_TOKEN,
+    org=INFLUXDB_ORG,
+    bucket=INFLUXDB_BUCKET,
+    range_start=INFLUXDB_RANGE_START,
+    window=INFLUXDB_WINDOW,
+)
@@ -29,14 +29,25 @@ class DataViewModel:
     Attributes:
         _data (Optional[pd.DataFrame]): Cached copy of the data to
             avoid unnecessary retrievals during a request lifecycle.
+        _latest_cache (Optional[tuple[Optional[float], dict[str, float]]]):
+            Latest metric values paired with the data-version token they
+            were derived from; the cache misses automatically whenever
+            the data actually reloads.
     """
 
     service: DataService
     _data: Optional[pd.DataFrame] = field(default=None, init=False, repr=False)
+    _loaded_version: Optional[float] = field(default=None, init=False, repr=False)
+    _latest_cache: Optional[tuple[Optional[float], dict[str, float]]] = field(default=None, init=False, repr=False)
+    _numeric_cols: tuple[str, ...] = field(default=(), init=False, repr=False)
 
     def load_data(self, force_reload: bool = False) -> pd.DataFrame:
         """Load data via the service and cache it locally.
 
+        The service's data version is consulted first, so polling
+        callers can omit ``force_reload`` and still pick up fresh data:
+        the pipeline only re-runs when the version token has changed.
+
         Args:
             force_reload (bool): Whether to force the service to
                 reload the data from the model.
@@ -44,17 +55,92 @@ class DataViewModel:
         Returns:
             pd.DataFrame: The loaded data.
         """
-        if self._data is None or force_reload:
-            self._data = self.service.get_data(force_reload=force_reload)
+        version = self.service.data_version()
+        stale = version != self._loaded_version
+        if self._data is None or force_reload or stale:
+            self._data = self._downcast_numerics(
+                self.service.get_data(force_reload=force_reload or stale)
+            )
+            # Dtypes are stable between reloads, so the numeric-column
+            # scan happens here once instead of in every callback.  An
+            # ordered tuple (not a set) keeps the cards in frame order.
+            self._numeric_cols = tuple(
+                c for c, d in self._data.dtypes.items()
+                if c != 'Time' and pd.api.types.is_numeric_dtype(d)
+            )
+            # Re-read the token: the reload may have refreshed the cache
+            self._loaded_version = self.service.data_version()
         return self._data
 
-    def get_time_series_data(self) -> pd.DataFrame:
-        """Return the full time series data for DIM2 statistics.
+    def _downcast_numerics(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Shrink numeric columns to the smallest sufficient dtype.
+
+        Runs once per load, so every later copy, slice and Plotly
+        serialization of the cached frame moves roughly half the bytes.
+
+        Args:
+            df (pd.DataFrame): Freshly loaded frame.
+
+        Returns:
+            pd.DataFrame: The same frame with downcast numeric columns.
+        """
+        for col in df.columns:
+            if col == 'Time':
+                continue
+            series = df[col]
+            try:
+                if pd.api.types.is_float_dtype(series):
+                    df[col] = pd.to_numeric(series, downcast='float')
+                elif pd.api.types.is_integer_dtype(series):
+                    df[col] = pd.to_numeric(series, downcast='integer')
+            except (TypeError, ValueError):
+                # Leave exotic (e.g. Arrow-backed) dtypes untouched
+                continue
+        return df
+
+    def get_time_series_data(self, window: Optional[int] = None) -> pd.DataFrame:
+        """Return the time series data for DIM2 statistics.
+
+        Args:
+            window (Optional[int]): If given, only rows from the last
+                ``window`` minutes are returned.  The frame is kept
+                sorted by Time, so the slice start is found with a
+                binary search instead of scanning every row.
 
         Returns:
             pd.DataFrame: Time series data with Time, Total Items, Good Reads, No Reads columns.
         """
-        return self.load_data()
+        df = self.load_data()
+        if window is None or df.empty or 'Time' not in df.columns:
+            return df
+        times = df['Time']
+        cutoff = times.iloc[-1] - pd.Timedelta(minutes=window)
+        start = times.searchsorted(cutoff)
+        return df.iloc[start:]
+
+    def get_series(self) -> tuple:
+        """Return the plotted series as raw numpy arrays.
+
+        The view can hand these straight to Plotly traces, bypassing
+        the DataFrame -> dict conversion that a DataFrame-based figure
+        factory performs on every callback.  The arrays are views onto
+        the cached frame's blocks, not copies.
+
+        Returns:
+            tuple: ``(time, total_items, good_reads, no_reads)`` arrays.
+        """
+        df = self.load_data()
+        if df.empty or 'Time' not in df.columns:
+            import numpy as np
+
+            empty = np.empty(0)
+            return empty, empty, empty, empty
+        return (
+            df['Time'].to_numpy(),
+            df['Total Items'].to_numpy(),
+            df['Good Reads'].to_numpy(),
+            df['No Reads'].to_numpy(),
+        )
 
     def get_metrics_list(self) -> List[str]:
         """Return a list of available metrics for visualization.
@@ -62,10 +148,10 @@ class DataViewModel:
         Returns:
             list[str]: List of metric names.
         """
-        df = self.load_data()
-        # Return all numeric columns except Time
-        numeric_cols = [col for col in df.columns if col != 'Time' and pd.api.types.is_numeric_dtype(df[col])]
-        return numeric_cols
+        # The numeric columns (everything except Time) are computed
+        # once per reload in load_data; no per-call dtype inspection.
+        self.load_data()
+        return list(self._numeric_cols)
 
     def get_latest_values(self) -> dict[str, float]:
         """Return the latest values for each metric.
@@ -74,14 +160,19 @@ class DataViewModel:
             dict[str, float]: Dictionary mapping metric names to their latest values.
         """
         df = self.load_data()
+        # load_data just refreshed _loaded_version, so keying on it
+        # invalidates exactly when the underlying data changed.
+        version = self._loaded_version
+        if self._latest_cache is not None and self._latest_cache[0] == version:
+            return self._latest_cache[1]
         if df.empty or 'Time' not in df.columns:
             return {}
-        
-        # Get the latest row
-        latest_row = df.iloc[-1]
-        result = {}
-        for col in df.columns:
-            if col != 'Time' and pd.api.types.is_numeric_dtype(df[col]):
-                result[col] = float(latest_row[col])
-        
+
+        # Pull the last row straight from the numeric block; iloc[-1]
+        # would build a full Series and box each value separately.
+        numeric_cols = list(self._numeric_cols)
+        last = df[numeric_cols].to_numpy(copy=False)[-1]
+        result = dict(zip(numeric_cols, last.tolist()))
+
+        self._latest_cache = (version, result)
         return result
\ No newline at end of file
@@ -10,11 +10,34 @@ from __future__ import annotations
 
 from typing import Any, List, Optional
 
-import plotly.express as px
-from dash import Dash, Input, Output, dcc, html
+import plotly.io as pio
+from dash import Dash, Input, Output, State, dcc, html
+from dash.exceptions import PreventUpdate
+
+try:  # Optional dependency: serializes numpy arrays in one C pass
+    import orjson  # type: ignore # noqa: F401
+
+    pio.json.config.default_engine = "orjson"
+except Exception:  # pragma: no cover - optional dependency handling
+    pass
 
 from viewmodels.data_viewmodel import DataViewModel
 
+# Static style dicts for the latest-value cards, built once at import
+# instead of being re-allocated for every card on every tick.
+_CARD_STYLE = {
+    "border": "1px solid #ddd",
+    "borderRadius": "5px",
+    "padding": "1rem",
+    "textAlign": "center",
+    "margin": "0.5rem",
+    "flex": "1",
+}
+_CARD_TITLE_STYLE = {"display": "block", "fontWeight": "bold"}
+_CARD_VALUE_STYLE = {"display": "block", "fontSize": "1.8rem", "color": "#1f77b4"}
+_CARD_ROW_STYLE = {"display": "flex", "justifyContent": "space-around"}
+_NO_DATA_STYLE = {"textAlign": "center"}
+
 
 def create_app(view_model: DataViewModel) -> Dash:
     """Create and configure a Dash application for DIM2 time series monitoring.
@@ -39,7 +62,10 @@ def create_app(view_model: DataViewModel) -> Dash:
             
             # Time series chart
             dcc.Graph(id="timeseries-chart"),
-            
+
+            # Raw series data shared with the clientside renderer
+            dcc.Store(id="data-store"),
+
             # Auto-refresh component
             dcc.Interval(
                 id='interval-component',
@@ -49,95 +75,166 @@ def create_app(view_model: DataViewModel) -> Dash:
         ],
     )
 
-    # Callback to update latest values display
-    @app.callback(
-        Output("latest-values", "children"),
-        Input("interval-component", "n_intervals"),
-    )
-    def update_latest_values(n: int) -> List[Any]:
-        """Update the latest values display.
-
-        Args:
-            n (int): Number of intervals elapsed.
+    def _build_latest_values() -> List[Any]:
+        """Build the latest values display from the loaded data.
 
         Returns:
             List[Any]: List of HTML components showing latest values.
         """
-        # Force reload to get fresh data
-        view_model.load_data(force_reload=True)
         latest_values = view_model.get_latest_values()
-        
+
         if not latest_values:
-            return [html.Div("No data available", style={"textAlign": "center"})]
-        
-        cards = []
-        for metric, value in latest_values.items():
-            card = html.Div([
-                html.H4(metric, style={"margin": "0"}),
-                html.H2(f"{value:,.0f}", style={"margin": "0", "color": "#1f77b4"})
-            ], style={
-                "border": "1px solid #ddd", 
-                "borderRadius": "5px", 
-                "padding": "1rem", 
-                "textAlign": "center",
-                "margin": "0.5rem",
-                "flex": "1"
-            })
-            cards.append(card)
-        
-        return [html.Div(cards, style={"display": "flex", "justifyContent": "space-around"})]
-
-    # Callback to update the time series chart
+            return [html.Div("No data available", style=_NO_DATA_STYLE)]
+
+        # Round/unbox all values in one numpy pass, then format the
+        # resulting Python ints, which is cheaper than calling float
+        # __format__ per value.
+        import numpy as np
+
+        rounded = np.rint(
+            np.fromiter(latest_values.values(), dtype=np.float64, count=len(latest_values))
+        ).astype(np.int64).tolist()
+        labels = [f"{v:,}" for v in rounded]
+
+        # Flat Span pair per card with shared style objects: fewer
+        # component allocations and a smaller serialized payload than
+        # the old nested Div/H4/H2 trees.
+        cards = [
+            html.Div(
+                [
+                    html.Span(metric, style=_CARD_TITLE_STYLE),
+                    html.Span(label, style=_CARD_VALUE_STYLE),
+                ],
+                style=_CARD_STYLE,
+            )
+            for metric, label in zip(latest_values, labels)
+        ]
+        return [html.Div(cards, style=_CARD_ROW_STYLE)]
+
+    def _build_store_data() -> Optional[dict]:
+        """Build the small JSON payload the clientside renderer plots.
+
+        Returns:
+            Optional[dict]: Series arrays as JSON-safe lists, or None
+            when no data is available.
+        """
+        time_arr, total_arr, good_arr, no_arr = view_model.get_series()
+        if time_arr.size == 0:
+            return None
+        if time_arr.dtype == object:  # tz-aware timestamps
+            x = [t.isoformat() for t in time_arr]
+        else:
+            import numpy as np
+
+            x = np.datetime_as_string(time_arr, unit='ms').tolist()
+        return {
+            'x': x,
+            'total': total_arr.tolist(),
+            'good': good_arr.tolist(),
+            'no': no_arr.tolist(),
+        }
+
+    # Prebuilt card components keyed on the service's data-version
+    # token.  PreventUpdate only spares repeat ticks from the same
+    # client; every freshly opened tab still fires an initial call that
+    # must be answered, and those are served from here instead of
+    # rebuilding the component tree.
+    cards_cache: dict = {}
+
+    # Single server callback: one HTTP roundtrip and one data load per
+    # interval tick, and the cards can never show a different refresh
+    # than the chart.
     @app.callback(
-        Output("timeseries-chart", "figure"),
+        Output("latest-values", "children"),
+        Output("data-store", "data"),
         Input("interval-component", "n_intervals"),
+        State("data-store", "data"),
     )
-    def update_timeseries_chart(n: int) -> Any:
-        """Update time series chart with DIM2 statistics.
+    def update_dashboard(n: int, current: Optional[dict]) -> tuple:
+        """Refresh the latest-value cards and the shared series data.
 
         Args:
             n (int): Number of intervals elapsed.
+            current (Optional[dict]): The payload this client's store
+                already holds, so staleness is judged per client.
 
         Returns:
-            plotly.graph_objs._figure.Figure: A time series figure.
+            tuple: ``(children, store_data)`` for the two outputs.
+
+        Raises:
+            PreventUpdate: When this client already holds the newest
+                rows, so neither output (nor the client redraw) runs.
         """
-        # Force reload to get fresh data
-        df = view_model.get_time_series_data()
-        
-        if df.empty or 'Time' not in df.columns:
-            # Return empty figure if no data
+        # The viewmodel reloads only when the data version changed
+        view_model.load_data()
+        data = _build_store_data()
+        newest = data['x'][-1] if data else None
+        # A fresh tab's store is empty, so it is always answered; other
+        # clients are only skipped when their own store is up to date.
+        held = current['x'][-1] if current and current.get('x') else None
+        if newest is not None and newest == held:
+            raise PreventUpdate
+        version = view_model.service.data_version()
+        if version not in cards_cache:
+            cards_cache.clear()  # single entry: old versions never recur
+            cards_cache[version] = _build_latest_values()
+        return cards_cache[version], data
+
+    # The figure itself is assembled in the browser from the store
+    # payload, so unchanged ticks cost the server no serialization at
+    # all and hidden tabs skip the redraw entirely.
+    app.clientside_callback(
+        """
+        function(data) {
+            if (document.hidden) {
+                return window.dash_clientside.no_update;
+            }
+            if (!data || !data.x || data.x.length === 0) {
+                return {
+                    data: [],
+                    layout: {
+                        title: 'No data available',
+                        xaxis: {title: 'Time'},
+                        yaxis: {title: 'Count'}
+                    }
+                };
+            }
+            var series = [
+                ['total', 'Total Items'],
+                ['good', 'Good Reads'],
+                ['no', 'No Reads']
+            ];
+            var traces = series.map(function(s) {
+                return {
+                    type: 'scattergl',
+                    mode: 'lines',
+                    name: s[1],
+                    x: data.x,
+                    y: data[s[0]]
+                };
+            });
             return {
-                'data': [],
-                'layout': {
-                    'title': 'No data available',
-                    'xaxis': {'title': 'Time'},
-                    'yaxis': {'title': 'Count'}
+                data: traces,
+                layout: {
+                    title: 'DIM2 Statistics Over Time',
+                    xaxis: {title: 'Time'},
+                    yaxis: {title: 'Count'},
+                    height: 500,
+                    hovermode: 'x unified',
+                    plot_bgcolor: 'white',
+                    legend: {
+                        orientation: 'h',
+                        yanchor: 'bottom',
+                        y: 1.02,
+                        xanchor: 'right',
+                        x: 1
+                    }
                 }
-            }
-        
-        # Create time series plot with multiple metrics
-        fig = px.line(
-            df, 
-            x='Time', 
-            y=['Total Items', 'Good Reads', 'No Reads'],
-            title='DIM2 Statistics Over Time',
-            labels={'value': 'Count', 'variable': 'Metric', 'Time': 'Time'},
-            template='plotly_white'
-        )
-        
-        # Customize layout
-        fig.update_layout(
-            height=500,
-            hovermode='x unified',
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
-        )
-        
-        return fig
+            };
+        }
+        """,
+        Output("timeseries-chart", "figure"),
+        Input("data-store", "data"),
+    )
 
     return app
\ No newline at end of file